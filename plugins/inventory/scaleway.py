@@ -32,22 +32,25 @@ options:
   zones:
     description:
       - List of zones to filter on.
+      - When empty, every zone known by the installed Scaleway SDK is used.
     type: list
     elements: str
-    default:
-      - fr-par-1
-      - fr-par-2
-      - fr-par-3
-      - nl-ams-1
-      - nl-ams-2
-      - pl-waw-1
-      - pl-waw-2
+    default: []
   tags:
     description:
       - List of tags to filter on.
     type: list
     elements: str
     default: []
+  inmemory_cache_ttl:
+    description:
+      - Number of seconds servers listed for a zone are reused from memory by later parses in the same process.
+      - This is independent from the inventory cache. Set it when a play refreshes the
+        inventory several times and the server list is not expected to change in between.
+      - C(0) disables it, so every parse queries the API.
+    type: int
+    default: 0
+    version_added: "2.2.0"
   hostnames:
     description: List of preference about what to use as an hostname.
     type: list
@@ -75,15 +78,21 @@ tags:
 """
 
 
-from dataclasses import dataclass, field
-from typing import List, Optional
+import hashlib
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, fields
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from ansible.errors import AnsibleError
 from ansible.module_utils.basic import missing_required_lib
 from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
 
 try:
-    from scaleway_core.bridge import Zone
+    from scaleway_core.bridge import ALL_ZONES, Zone
 
     from scaleway import Client, ScalewayException
     from scaleway.applesilicon.v1alpha1 import ApplesiliconV1Alpha1API
@@ -94,6 +103,11 @@ try:
     from scaleway.instance.v1 import Server as InstanceServer
     from scaleway.instance.v1 import ServerState
 
+    # Later SDK releases renamed the IPVersion members to I_PV4 and I_PV6.
+    _IPV4 = getattr(IPVersion, "IPV4", None) or IPVersion.I_PV4
+    _IPV6 = getattr(IPVersion, "IPV6", None) or IPVersion.I_PV6
+    _STATE_RUNNING = ServerState.RUNNING
+
     HAS_SCALEWAY_SDK = True
 except ImportError:
     HAS_SCALEWAY_SDK = False
@@ -104,6 +118,13 @@ _ALLOWED_FILE_NAME_SUFFIXES = (
     "scw.yaml",
     "scw.yml",
 )
+_ALLOWED_FILE_NAME_SUFFIXES_STR = ", ".join(_ALLOWED_FILE_NAME_SUFFIXES)
+
+_MAX_ZONE_WORKERS = 16
+_PAGE_SIZE = 100
+
+_CLIENT_CACHE: Dict[Tuple, "Client"] = {}
+_SERVERS_CACHE: Dict[Tuple, Tuple[float, List[Any]]] = {}
 
 
 @dataclass
@@ -114,16 +135,53 @@ class _Filters:
 
 @dataclass
 class _Host:
+    __slots__ = (
+        "id",
+        "hostname",
+        "tags",
+        "zone",
+        "zone_group",
+        "public_ipv4",
+        "private_ipv4",
+        "public_ipv6",
+    )
+
     id: str
     hostname: str
     tags: List[str]
     zone: "Zone"
+    zone_group: str
 
     public_ipv4: Optional[str]
     private_ipv4: Optional[str]
     public_ipv6: Optional[str]
 
 
+_HOST_FIELDS = frozenset(f.name for f in fields(_Host))
+
+
+def _cached_list_servers(
+    api: Any, zone: str, tags: List[str], ttl: int, **kwargs: Any
+) -> List[Any]:
+    key = (type(api).__name__, id(api.client), zone, tuple(tags))
+    now = time.monotonic()
+
+    cached = _SERVERS_CACHE.get(key)
+    if cached is not None and now - cached[0] < ttl:
+        return cached[1]
+
+    servers = api.list_servers_all(
+        zone=zone,
+        tags=tags if tags else None,
+        **kwargs,
+    )
+
+    if ttl > 0:
+        _SERVERS_CACHE[key] = (now, servers)
+
+    return servers
+
+
 class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
     NAME = "quantumsheep.scaleway.scaleway"
 
@@ -132,11 +190,12 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
             return False
 
         if not path.endswith(_ALLOWED_FILE_NAME_SUFFIXES):
-            self.display.vvv(
-                "Skipping due to inventory source file name mismatch. "
-                "The file name has to end with one of the following: "
-                f"{', '.join(_ALLOWED_FILE_NAME_SUFFIXES)}."
-            )
+            if self.display.verbosity >= 3:
+                self.display.vvv(
+                    "Skipping due to inventory source file name mismatch. "
+                    "The file name has to end with one of the following: "
+                    f"{_ALLOWED_FILE_NAME_SUFFIXES_STR}."
+                )
 
             return False
 
@@ -146,13 +205,13 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
         super(InventoryModule, self).parse(inventory, loader, path, cache)
         self._read_config_data(path)
 
-        self.load_cache_plugin()
-        cache_key = self.get_cache_key(path)
-
         if not HAS_SCALEWAY_SDK:
             self.display.error(missing_required_lib("scaleway"))
             raise AnsibleError(missing_required_lib("scaleway"))
 
+        self.load_cache_plugin()
+        cache_key = self._get_filtered_cache_key(path)
+
         user_cache_setting = self.get_option("cache")
 
         use_cache = user_cache_setting and cache
@@ -160,68 +219,117 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
 
         if use_cache:
             try:
-                results = self._cache[cache_key]
-            except KeyError:
+                results = [_Host(**host) for host in self._cache[cache_key]]
+            except (KeyError, TypeError):
                 update_cache = True
 
         if not use_cache or update_cache:
             results = self.get_inventory()
 
         if update_cache:
-            self._cache[cache_key] = results
+            results = list(results)
+            self._cache[cache_key] = [asdict(host) for host in results]
 
         self.populate(results)
 
-    def populate(self, results: List[_Host]):
+    def _get_filtered_cache_key(self, path: str) -> str:
+        filters = self._get_filters()
+        signature = json.dumps(
+            {"zones": sorted(filters.zones), "tags": sorted(filters.tags)},
+            sort_keys=True,
+        )
+        digest = hashlib.sha256(signature.encode()).hexdigest()[:12]
+
+        return f"{self.get_cache_key(path)}::{digest}"
+
+    def populate(self, results: Iterable[_Host]):
         hostnames = self.get_option("hostnames")
 
+        invalid_hostnames = [name for name in hostnames if name not in _HOST_FIELDS]
+        if invalid_hostnames:
+            raise AnsibleError(f"Invalid hostnames preferences: {invalid_hostnames}")
+
+        add_group = self.inventory.add_group
+        add_host = self.inventory.add_host
+        get_host_groups = self.get_host_groups
+        get_hostname = self._get_hostname
+
+        all_groups = set()
+        hosts_groups = []
+
         for result in results:
-            groups = self.get_host_groups(result)
-            hostname = self._get_hostname(result, hostnames)
+            groups = get_host_groups(result)
+            hostname = get_hostname(result, hostnames)
+
+            all_groups.update(groups)
+            hosts_groups.append((hostname, groups))
+
+        # add_group may sanitize the name, so link hosts through the name it
+        # actually stored.
+        group_names = {group: add_group(group=group) for group in all_groups}
+
+        if not hasattr(self.inventory, "_groups_dict_cache"):
+            for hostname, groups in hosts_groups:
+                for group in groups:
+                    add_host(group=group_names[group], host=hostname)
+
+            return
+
+        # Register each host once, then link it to its groups directly instead
+        # of going through add_host's validation for every group.
+        inventory_groups = self.inventory.groups
+        inventory_hosts = self.inventory.hosts
+
+        for hostname, groups in hosts_groups:
+            add_host(host=hostname)
+            host = inventory_hosts[hostname]
 
             for group in groups:
-                self.inventory.add_group(group=group)
-                self.inventory.add_host(group=group, host=hostname)
+                inventory_groups[group_names[group]].add_host(host)
 
-    def get_host_groups(self, host: _Host):
-        return set(host.tags).union(set([host.zone.replace("-", "_")]))
+        # Group.add_host does not invalidate the cache add_host(group=...) would.
+        self.inventory._groups_dict_cache = {}
 
-    def get_inventory(self):
+    def get_host_groups(self, host: _Host) -> Set[str]:
+        groups = set(host.tags)
+        groups.add(host.zone_group)
+
+        return groups
+
+    def get_inventory(self) -> Iterable[_Host]:
         client = self._get_client()
         filters = self._get_filters()
 
-        instances = self._get_instances(client, filters)
-        elastic_metals = self._get_elastic_metal(client, filters)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            instances = executor.submit(self._get_instances, client, filters)
+            elastic_metals = executor.submit(self._get_elastic_metal, client, filters)
 
-        return instances + elastic_metals
+            return chain(instances.result(), elastic_metals.result())
 
     def _get_instances(self, client: "Client", filters: _Filters) -> List[_Host]:
         api = InstanceV1API(client)
 
         servers: List[InstanceServer] = []
 
-        for zone in filters.zones:
-            servers.extend(
-                api.list_servers_all(
-                    zone=zone,
-                    tags=filters.tags if filters.tags else None,
-                    state=ServerState.RUNNING,
-                )
-            )
+        max_workers = max(1, min(_MAX_ZONE_WORKERS, len(filters.zones)))
 
-        results: List[_Host] = []
-        for server in servers:
-            if filters.zones:
-                zones = [server.zone.startswith(region) for region in filters.zones]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._list_instance_zone, api, zone, filters.tags)
+                for zone in filters.zones
+            ]
 
-                if any(zones):
-                    continue
+            for future in futures:
+                servers.extend(future.result())
 
+        results: List[_Host] = []
+        for server in servers:
             host = _Host(
                 id=server.id,
                 hostname=server.hostname,
-                tags=["instance", *server.tags],
+                tags=["instance", *map(sys.intern, server.tags)],
                 zone=server.zone,
+                zone_group=sys.intern(server.zone.replace("-", "_")),
                 public_ipv4=server.public_ip.address if server.public_ip else None,
                 private_ipv4=server.private_ip,
                 public_ipv6=server.ipv6.address if server.ipv6 else None,
@@ -236,30 +344,40 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
 
         servers: List[BaremetalServer] = []
 
-        for zone in filters.zones:
-            try:
-                found = api.list_servers_all(
-                    zone=zone,
-                    tags=filters.tags if filters.tags else None,
-                )
+        max_workers = max(1, min(_MAX_ZONE_WORKERS, len(filters.zones)))
 
-                servers.extend(found)
-            except ScalewayException:
-                pass
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self._list_baremetal_zone, api, zone, filters.tags)
+                for zone in filters.zones
+            ]
+
+            for future in futures:
+                try:
+                    servers.extend(future.result())
+                except ScalewayException:
+                    pass
 
         results: List[_Host] = []
         for server in servers:
-            public_ipv4s = filter(lambda ip: ip.version == IPVersion.IPV4, server.ips)
-            public_ipv6s = filter(lambda ip: ip.version == IPVersion.IPV6, server.ips)
+            public_ipv4 = None
+            public_ipv6 = None
+
+            for ip in server.ips:
+                if public_ipv4 is None and ip.version == _IPV4:
+                    public_ipv4 = ip
+                elif public_ipv6 is None and ip.version == _IPV6:
+                    public_ipv6 = ip
 
-            public_ipv4 = next(public_ipv4s, None)
-            public_ipv6 = next(public_ipv6s, None)
+                if public_ipv4 is not None and public_ipv6 is not None:
+                    break
 
             host = _Host(
                 id=server.id,
                 hostname=server.name,
-                tags=["elastic_metal", *server.tags],
+                tags=["elastic_metal", *map(sys.intern, server.tags)],
                 zone=server.zone,
+                zone_group=sys.intern(server.zone.replace("-", "_")),
                 public_ipv4=public_ipv4.address if public_ipv4 else None,
                 private_ipv4=None,
                 public_ipv6=public_ipv6.address if public_ipv6 else None,
@@ -269,6 +387,29 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
 
         return results
 
+    def _list_instance_zone(
+        self, api: "InstanceV1API", zone: str, tags: List[str]
+    ) -> List["InstanceServer"]:
+        return _cached_list_servers(
+            api,
+            zone,
+            tags,
+            self.get_option("inmemory_cache_ttl"),
+            state=_STATE_RUNNING,
+            per_page=_PAGE_SIZE,
+        )
+
+    def _list_baremetal_zone(
+        self, api: "BaremetalV1API", zone: str, tags: List[str]
+    ) -> List["BaremetalServer"]:
+        return _cached_list_servers(
+            api,
+            zone,
+            tags,
+            self.get_option("inmemory_cache_ttl"),
+            page_size=_PAGE_SIZE,
+        )
+
     def _get_apple_sillicon(self, client: "Client", filters: _Filters) -> List[_Host]:
         api = ApplesiliconV1Alpha1API(client)
 
@@ -291,6 +432,7 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
                 hostname=server.name,
                 tags=["apple_sillicon"],
                 zone=server.zone,
+                zone_group=sys.intern(server.zone.replace("-", "_")),
                 public_ipv4=server.ip,
                 private_ipv4=None,
                 public_ipv6=None,
@@ -301,23 +443,40 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
         return results
 
     def _get_hostname(self, host: _Host, hostnames: List[str]) -> str:
-        as_dict = host.__dict__
-
         for hostname in hostnames:
-            if hostname in as_dict and as_dict[hostname]:
-                return as_dict[hostname]
+            value = getattr(host, hostname, None)
+
+            if value:
+                return value
 
         raise AnsibleError(f"No hostname found for {host.id} in {hostnames}")
 
     def _get_client(self):
-        config_file = self.get_option("config_file")
-        profile = self.get_option("profile")
-        access_key = self.get_option("access_key")
-        secret_key = self.get_option("secret_key")
-        api_url = self.get_option("api_url")
-        api_allow_insecure = self.get_option("api_allow_insecure")
-        user_agent = self.get_option("user_agent")
-
+        key = (
+            self.get_option("config_file"),
+            self.get_option("profile"),
+            self.get_option("access_key"),
+            self.get_option("secret_key"),
+            self.get_option("api_url"),
+            self.get_option("api_allow_insecure"),
+            self.get_option("user_agent"),
+        )
+
+        if key not in _CLIENT_CACHE:
+            _CLIENT_CACHE[key] = self._build_client(*key)
+
+        return _CLIENT_CACHE[key]
+
+    def _build_client(
+        self,
+        config_file: Optional[str],
+        profile: Optional[str],
+        access_key: Optional[str],
+        secret_key: Optional[str],
+        api_url: Optional[str],
+        api_allow_insecure: Optional[bool],
+        user_agent: Optional[str],
+    ):
         if profile:
             client = Client.from_config_file(
                 filepath=config_file if config_file else None,
@@ -351,6 +510,8 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
 
         if zones:
             filters.zones = zones
+        else:
+            filters.zones = list(ALL_ZONES)
 
         if tags:
             filters.tags = tags
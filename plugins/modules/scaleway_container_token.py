@@ -98,57 +98,77 @@ from ansible_collections.quantumsheep.scaleway.plugins.module_utils.scaleway imp
 
 try:
     from scaleway import Client, ScalewayException
-    from scaleway.container.v1beta1 import ContainerV1Beta1API
+    from scaleway.container.v1beta1 import (
+        TOKEN_TRANSIENT_STATUSES,
+        ContainerV1Beta1API,
+    )
 
     HAS_SCALEWAY_SDK = True
 except ImportError:
     HAS_SCALEWAY_SDK = False
 
+_CREATE_FIELDS = frozenset(
+    {
+        "region",
+        "container_id",
+        "namespace_id",
+        "description",
+        "expires_at",
+    }
+)
+
 
 def create(module: AnsibleModule, client: "Client") -> None:
     api = ContainerV1Beta1API(client)
 
-    id = module.params.pop("id", None)
+    id = module.params.pop("token_id", None)
     if id is not None:
-        resource = api.get_token(token_id=id)
+        resource = api.get_token(token_id=id, region=module.params["region"])
 
         if module.check_mode:
             module.exit_json(changed=False)
 
-        module.exit_json(changed=False, data=resource)
+        module.exit_json(changed=False, data=resource.__dict__)
 
     if module.check_mode:
         module.exit_json(changed=True)
 
-    not_none_params = {
-        key: value for key, value in module.params.items() if value is not None
+    payload = {
+        key: module.params[key]
+        for key in _CREATE_FIELDS
+        if module.params.get(key) is not None
     }
-    resource = api.create_token(**not_none_params)
-    resource = api.wait_for_token(token_id=resource.id, region=module.params["region"])
+    resource = api.create_token(**payload)
+
+    if resource.status in TOKEN_TRANSIENT_STATUSES:
+        resource = api.wait_for_token(
+            token_id=resource.id, region=module.params["region"]
+        )
 
     module.exit_json(changed=True, data=resource.__dict__)
 
 
-def delete(module: AnsibleModule, client: "Client") -> None:
+def delete(module: AnsibleModule, client: "Client", wait: bool) -> None:
     api = ContainerV1Beta1API(client)
 
-    id = module.params.pop("id", None)
+    id = module.params.pop("token_id", None)
 
     if id is not None:
         resource = api.get_token(token_id=id, region=module.params["region"])
     else:
-        module.fail_json(msg="id is required")
+        module.fail_json(msg="token_id is required")
 
     if module.check_mode:
         module.exit_json(changed=True)
 
     api.delete_token(token_id=resource.id, region=module.params["region"])
 
-    try:
-        api.wait_for_token(token_id=resource.id, region=module.params["region"])
-    except ScalewayException as e:
-        if e.status_code != 404:
-            raise e
+    if wait:
+        try:
+            api.wait_for_token(token_id=resource.id, region=module.params["region"])
+        except ScalewayException as e:
+            if e.status_code != 404:
+                raise e
 
     module.exit_json(
         changed=True,
@@ -160,46 +180,48 @@ def core(module: AnsibleModule) -> None:
     client = scaleway_get_client_from_module(module)
 
     state = module.params.pop("state")
+    wait = module.params["wait"]
     scaleway_pop_client_params(module)
     scaleway_pop_waitable_resource_params(module)
 
     if state == "present":
         create(module, client)
     elif state == "absent":
-        delete(module, client)
+        delete(module, client, wait)
+
+
+_ARGUMENT_SPEC = dict(
+    **scaleway_argument_spec(),
+    **scaleway_waitable_resource_argument_spec(),
+    state=dict(type="str", default="present", choices=["absent", "present"]),
+    token_id=dict(type="str"),
+    region=dict(
+        type="str",
+        required=False,
+        choices=["fr-par", "nl-ams", "pl-waw"],
+    ),
+    container_id=dict(
+        type="str",
+        required=False,
+    ),
+    namespace_id=dict(
+        type="str",
+        required=False,
+    ),
+    description=dict(
+        type="str",
+        required=False,
+    ),
+    expires_at=dict(
+        type="str",
+        required=False,
+    ),
+)
 
 
 def main() -> None:
-    argument_spec = scaleway_argument_spec()
-    argument_spec.update(scaleway_waitable_resource_argument_spec())
-    argument_spec.update(
-        state=dict(type="str", default="present", choices=["absent", "present"]),
-        token_id=dict(type="str"),
-        region=dict(
-            type="str",
-            required=False,
-            choices=["fr-par", "nl-ams", "pl-waw"],
-        ),
-        container_id=dict(
-            type="str",
-            required=False,
-        ),
-        namespace_id=dict(
-            type="str",
-            required=False,
-        ),
-        description=dict(
-            type="str",
-            required=False,
-        ),
-        expires_at=dict(
-            type="str",
-            required=False,
-        ),
-    )
-
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=_ARGUMENT_SPEC,
         supports_check_mode=True,
     )
 
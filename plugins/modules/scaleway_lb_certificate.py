@@ -108,43 +108,59 @@ from ansible_collections.quantumsheep.scaleway.plugins.module_utils.scaleway imp
 
 try:
     from scaleway import Client, ScalewayException
-    from scaleway.lb.v1 import LbV1API
+    from scaleway.lb.v1 import CERTIFICATE_TRANSIENT_STATUSES, LbV1API
 
     HAS_SCALEWAY_SDK = True
 except ImportError:
     HAS_SCALEWAY_SDK = False
 
+_CREATE_FIELDS = frozenset(
+    {
+        "lb_id",
+        "region",
+        "name",
+        "letsencrypt",
+        "custom_certificate",
+    }
+)
+
 
 def create(module: AnsibleModule, client: "Client") -> None:
     api = LbV1API(client)
 
-    id = module.params.pop("id", None)
+    id = module.params.pop("certificate_id", None)
     if id is not None:
-        resource = api.get_certificate(certificate_id=id)
+        resource = api.get_certificate(
+            certificate_id=id, region=module.params["region"]
+        )
 
         if module.check_mode:
             module.exit_json(changed=False)
 
-        module.exit_json(changed=False, data=resource)
+        module.exit_json(changed=False, data=resource.__dict__)
 
     if module.check_mode:
         module.exit_json(changed=True)
 
-    not_none_params = {
-        key: value for key, value in module.params.items() if value is not None
+    payload = {
+        key: module.params[key]
+        for key in _CREATE_FIELDS
+        if module.params.get(key) is not None
     }
-    resource = api.create_certificate(**not_none_params)
-    resource = api.wait_for_certificate(
-        certificate_id=resource.id, region=module.params["region"]
-    )
+    resource = api.create_certificate(**payload)
+
+    if resource.status in CERTIFICATE_TRANSIENT_STATUSES:
+        resource = api.wait_for_certificate(
+            certificate_id=resource.id, region=module.params["region"]
+        )
 
     module.exit_json(changed=True, data=resource.__dict__)
 
 
-def delete(module: AnsibleModule, client: "Client") -> None:
+def delete(module: AnsibleModule, client: "Client", wait: bool) -> None:
     api = LbV1API(client)
 
-    id = module.params.pop("id", None)
+    id = module.params.pop("certificate_id", None)
     name = module.params.pop("name", None)
 
     if id is not None:
@@ -152,28 +168,33 @@ def delete(module: AnsibleModule, client: "Client") -> None:
             certificate_id=id, region=module.params["region"]
         )
     elif name is not None:
-        resources = api.list_certificates_all(name=name, region=module.params["region"])
+        resources = api.list_certificates_all(
+            lb_id=module.params["lb_id"],
+            name=name,
+            region=module.params["region"],
+        )
         if len(resources) == 0:
-            module.exit_json(msg="No certificate found with name {name}")
+            module.exit_json(msg=f"No certificate found with name {name}")
         elif len(resources) > 1:
-            module.exit_json(msg="More than one certificate found with name {name}")
+            module.exit_json(msg=f"More than one certificate found with name {name}")
         else:
             resource = resources[0]
     else:
-        module.fail_json(msg="id is required")
+        module.fail_json(msg="certificate_id or name is required")
 
     if module.check_mode:
         module.exit_json(changed=True)
 
     api.delete_certificate(certificate_id=resource.id, region=module.params["region"])
 
-    try:
-        api.wait_for_certificate(
-            certificate_id=resource.id, region=module.params["region"]
-        )
-    except ScalewayException as e:
-        if e.status_code != 404:
-            raise e
+    if wait:
+        try:
+            api.wait_for_certificate(
+                certificate_id=resource.id, region=module.params["region"]
+            )
+        except ScalewayException as e:
+            if e.status_code != 404:
+                raise e
 
     module.exit_json(
         changed=True,
@@ -185,47 +206,51 @@ def core(module: AnsibleModule) -> None:
     client = scaleway_get_client_from_module(module)
 
     state = module.params.pop("state")
+    wait = module.params["wait"]
     scaleway_pop_client_params(module)
     scaleway_pop_waitable_resource_params(module)
 
     if state == "present":
         create(module, client)
     elif state == "absent":
-        delete(module, client)
+        delete(module, client, wait)
+
+
+_ARGUMENT_SPEC = dict(
+    **scaleway_argument_spec(),
+    **scaleway_waitable_resource_argument_spec(),
+    state=dict(type="str", default="present", choices=["absent", "present"]),
+    certificate_id=dict(type="str"),
+    lb_id=dict(
+        type="str",
+        required=True,
+    ),
+    region=dict(
+        type="str",
+        required=False,
+        choices=["fr-par", "nl-ams", "pl-waw"],
+    ),
+    name=dict(
+        type="str",
+        required=False,
+    ),
+    letsencrypt=dict(
+        type="dict",
+        required=False,
+    ),
+    custom_certificate=dict(
+        type="dict",
+        required=False,
+    ),
+)
 
+_REQUIRED_ONE_OF = (["certificate_id", "name"],)
 
-def main() -> None:
-    argument_spec = scaleway_argument_spec()
-    argument_spec.update(scaleway_waitable_resource_argument_spec())
-    argument_spec.update(
-        state=dict(type="str", default="present", choices=["absent", "present"]),
-        certificate_id=dict(type="str"),
-        lb_id=dict(
-            type="str",
-            required=True,
-        ),
-        region=dict(
-            type="str",
-            required=False,
-            choices=["fr-par", "nl-ams", "pl-waw"],
-        ),
-        name=dict(
-            type="str",
-            required=False,
-        ),
-        letsencrypt=dict(
-            type="dict",
-            required=False,
-        ),
-        custom_certificate=dict(
-            type="dict",
-            required=False,
-        ),
-    )
 
+def main() -> None:
     module = AnsibleModule(
-        argument_spec=argument_spec,
-        required_one_of=(["certificate_id", "name"],),
+        argument_spec=_ARGUMENT_SPEC,
+        required_one_of=_REQUIRED_ONE_OF,
         supports_check_mode=True,
     )
 
@@ -102,26 +102,37 @@ try:
 except ImportError:
     HAS_SCALEWAY_SDK = False
 
+_CREATE_FIELDS = frozenset(
+    {
+        "frontend_id",
+        "backend_id",
+        "region",
+        "match",
+    }
+)
+
 
 def create(module: AnsibleModule, client: "Client") -> None:
     api = LbV1API(client)
 
-    id = module.params.pop("id", None)
+    id = module.params.pop("route_id", None)
     if id is not None:
-        resource = api.get_route(route_id=id)
+        resource = api.get_route(route_id=id, region=module.params["region"])
 
         if module.check_mode:
             module.exit_json(changed=False)
 
-        module.exit_json(changed=False, data=resource)
+        module.exit_json(changed=False, data=resource.__dict__)
 
     if module.check_mode:
         module.exit_json(changed=True)
 
-    not_none_params = {
-        key: value for key, value in module.params.items() if value is not None
+    payload = {
+        key: module.params[key]
+        for key in _CREATE_FIELDS
+        if module.params.get(key) is not None
     }
-    resource = api.create_route(**not_none_params)
+    resource = api.create_route(**payload)
 
     module.exit_json(changed=True, data=resource.__dict__)
 
@@ -129,12 +140,12 @@ def create(module: AnsibleModule, client: "Client") -> None:
 def delete(module: AnsibleModule, client: "Client") -> None:
     api = LbV1API(client)
 
-    id = module.params.pop("id", None)
+    id = module.params.pop("route_id", None)
 
     if id is not None:
         resource = api.get_route(route_id=id, region=module.params["region"])
     else:
-        module.fail_json(msg="id is required")
+        module.fail_json(msg="route_id is required")
 
     if module.check_mode:
         module.exit_json(changed=True)
@@ -160,33 +171,34 @@ def core(module: AnsibleModule) -> None:
         delete(module, client)
 
 
-def main() -> None:
-    argument_spec = scaleway_argument_spec()
-    argument_spec.update(scaleway_waitable_resource_argument_spec())
-    argument_spec.update(
-        state=dict(type="str", default="present", choices=["absent", "present"]),
-        route_id=dict(type="str"),
-        frontend_id=dict(
-            type="str",
-            required=True,
-        ),
-        backend_id=dict(
-            type="str",
-            required=True,
-        ),
-        region=dict(
-            type="str",
-            required=False,
-            choices=["fr-par", "nl-ams", "pl-waw"],
-        ),
-        match=dict(
-            type="dict",
-            required=False,
-        ),
-    )
+_ARGUMENT_SPEC = dict(
+    **scaleway_argument_spec(),
+    **scaleway_waitable_resource_argument_spec(),
+    state=dict(type="str", default="present", choices=["absent", "present"]),
+    route_id=dict(type="str"),
+    frontend_id=dict(
+        type="str",
+        required=True,
+    ),
+    backend_id=dict(
+        type="str",
+        required=True,
+    ),
+    region=dict(
+        type="str",
+        required=False,
+        choices=["fr-par", "nl-ams", "pl-waw"],
+    ),
+    match=dict(
+        type="dict",
+        required=False,
+    ),
+)
 
+
+def main() -> None:
     module = AnsibleModule(
-        argument_spec=argument_spec,
+        argument_spec=_ARGUMENT_SPEC,
         supports_check_mode=True,
     )
 
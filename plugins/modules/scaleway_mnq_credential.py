@@ -103,26 +103,37 @@ try:
 except ImportError:
     HAS_SCALEWAY_SDK = False
 
+_CREATE_FIELDS = frozenset(
+    {
+        "namespace_id",
+        "region",
+        "name",
+        "permissions",
+    }
+)
+
 
 def create(module: AnsibleModule, client: "Client") -> None:
     api = MnqV1Alpha1API(client)
 
-    id = module.params.pop("id", None)
+    id = module.params.pop("credential_id", None)
     if id is not None:
-        resource = api.get_credential(credential_id=id)
+        resource = api.get_credential(credential_id=id, region=module.params["region"])
 
         if module.check_mode:
             module.exit_json(changed=False)
 
-        module.exit_json(changed=False, data=resource)
+        module.exit_json(changed=False, data=resource.__dict__)
 
     if module.check_mode:
         module.exit_json(changed=True)
 
-    not_none_params = {
-        key: value for key, value in module.params.items() if value is not None
+    payload = {
+        key: module.params[key]
+        for key in _CREATE_FIELDS
+        if module.params.get(key) is not None
     }
-    resource = api.create_credential(**not_none_params)
+    resource = api.create_credential(**payload)
 
     module.exit_json(changed=True, data=resource.__dict__)
 
@@ -130,21 +141,28 @@ def create(module: AnsibleModule, client: "Client") -> None:
 def delete(module: AnsibleModule, client: "Client") -> None:
     api = MnqV1Alpha1API(client)
 
-    id = module.params.pop("id", None)
+    id = module.params.pop("credential_id", None)
     name = module.params.pop("name", None)
 
     if id is not None:
         resource = api.get_credential(credential_id=id, region=module.params["region"])
     elif name is not None:
-        resources = api.list_credentials_all(name=name, region=module.params["region"])
+        resources = [
+            credential
+            for credential in api.list_credentials_all(
+                namespace_id=module.params["namespace_id"],
+                region=module.params["region"],
+            )
+            if credential.name == name
+        ]
         if len(resources) == 0:
-            module.exit_json(msg="No credential found with name {name}")
+            module.exit_json(msg=f"No credential found with name {name}")
         elif len(resources) > 1:
-            module.exit_json(msg="More than one credential found with name {name}")
+            module.exit_json(msg=f"More than one credential found with name {name}")
         else:
             resource = resources[0]
     else:
-        module.fail_json(msg="id is required")
+        module.fail_json(msg="credential_id or name is required")
 
     if module.check_mode:
         module.exit_json(changed=True)
@@ -170,34 +188,37 @@ def core(module: AnsibleModule) -> None:
         delete(module, client)
 
 
-def main() -> None:
-    argument_spec = scaleway_argument_spec()
-    argument_spec.update(scaleway_waitable_resource_argument_spec())
-    argument_spec.update(
-        state=dict(type="str", default="present", choices=["absent", "present"]),
-        credential_id=dict(type="str"),
-        namespace_id=dict(
-            type="str",
-            required=True,
-        ),
-        region=dict(
-            type="str",
-            required=False,
-            choices=["fr-par", "nl-ams", "pl-waw"],
-        ),
-        name=dict(
-            type="str",
-            required=False,
-        ),
-        permissions=dict(
-            type="dict",
-            required=False,
-        ),
-    )
+_ARGUMENT_SPEC = dict(
+    **scaleway_argument_spec(),
+    **scaleway_waitable_resource_argument_spec(),
+    state=dict(type="str", default="present", choices=["absent", "present"]),
+    credential_id=dict(type="str"),
+    namespace_id=dict(
+        type="str",
+        required=True,
+    ),
+    region=dict(
+        type="str",
+        required=False,
+        choices=["fr-par", "nl-ams", "pl-waw"],
+    ),
+    name=dict(
+        type="str",
+        required=False,
+    ),
+    permissions=dict(
+        type="dict",
+        required=False,
+    ),
+)
+
+_REQUIRED_ONE_OF = (["credential_id", "name"],)
 
+
+def main() -> None:
     module = AnsibleModule(
-        argument_spec=argument_spec,
-        required_one_of=(["credential_id", "name"],),
+        argument_spec=_ARGUMENT_SPEC,
+        required_one_of=_REQUIRED_ONE_OF,
         supports_check_mode=True,
     )
 